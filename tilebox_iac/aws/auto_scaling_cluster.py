@@ -1,11 +1,11 @@
 import base64
 import json
 from collections.abc import Sequence
+from functools import cache
 from pathlib import Path
-from typing import Any
 
 import pulumi_aws as aws
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from pulumi import ComponentResource, Input, InvokeOptions, InvokeOutputOptions, Output, ResourceOptions
 from pulumi_aws import autoscaling as aws_autoscaling
 from pulumi_aws import ec2 as aws_ec2
@@ -15,31 +15,73 @@ from tilebox_iac.aws.iam_role import IAMRole, IAMRoleConfigDict
 from tilebox_iac.aws.secrets import Secret
 from tilebox_iac.release_runner import RUNNER_IMAGE, encode_environment_variables, validate_environment_variable_name
 
-# This template renders cloud-init YAML rather than HTML.
-env = Environment(loader=FileSystemLoader(Path(__file__).parent), autoescape=False)  # noqa: S701
-template = env.get_template("cloud-init.yaml")
+
+def _get_user_data(
+    runner_image: Input[str],
+    environment_variables: dict[str, Input[str]],
+    secrets: dict[str, Input[str]],
+    secret_versions: dict[str, Input[str]],
+) -> Input[str]:
+    """Render the base64 user data directly when every input is already known, otherwise through an Output."""
+    plain_environment_variables = {key: value for key, value in environment_variables.items() if isinstance(value, str)}
+    if isinstance(runner_image, str) and not secrets and len(plain_environment_variables) == len(environment_variables):
+        return _encode_user_data(runner_image, plain_environment_variables, {}, {})
+    return Output.all(runner_image, environment_variables, secrets, secret_versions).apply(
+        lambda values: _encode_user_data(*values)
+    )
+
+
+def _encode_user_data(
+    runner_image: str,
+    environment_variables: dict[str, str],
+    secrets: dict[str, str],
+    secret_versions: dict[str, str],
+) -> str:
+    """Render the cloud-init config for the AWS VMs as base64-encoded user data."""
+    cloud_init = _render_cloud_init(
+        runner_image,
+        tuple(environment_variables.items()),
+        tuple(secrets.items()),
+        tuple(secret_versions.items()),
+    )
+    return base64.b64encode(cloud_init.encode()).decode()
 
 
-def _get_cloud_init(kwargs: dict[str, Any]) -> str:
-    """Render the cloud-init config for the AWS VMs."""
-    runner_image: str = kwargs["runner_image"]
+@cache
+def _get_template() -> Template:
+    """Load the cloud-init template on first use so importing the package does not parse it."""
+    # This template renders cloud-init YAML rather than HTML.
+    env = Environment(loader=FileSystemLoader(Path(__file__).parent), autoescape=False)  # noqa: S701
+    return env.get_template("cloud-init.yaml")
+
+
+@cache
+def _render_cloud_init(
+    runner_image: str,
+    environment_variables: tuple[tuple[str, str], ...],
+    secrets: tuple[tuple[str, str], ...],
+    secret_versions: tuple[tuple[str, str], ...],
+) -> str:
+    """Render the cloud-init template once per distinct set of inputs, since clusters often share them."""
     registry_hostname = runner_image.split("/", maxsplit=1)[0]
     registry_parts = registry_hostname.split(".")
     ecr_region = registry_parts[3] if len(registry_parts) > 3 and registry_parts[1:3] == ["dkr", "ecr"] else None
-    environment_variables: dict[str, str] = kwargs["environment_variables"]
-    secrets: dict[str, str] = kwargs["secrets"]
-    secret_versions: dict[str, str] = kwargs["secret_versions"]
 
-    return template.render(
+    return _get_template().render(
         CONTAINER_IMAGE=runner_image,
         ECR_REGION=ecr_region,
         REGISTRY_HOSTNAME=registry_hostname,
-        SECRETS=secrets,
-        SECRET_VERSIONS=secret_versions,
-        ENVIRONMENT_FILE=encode_environment_variables(environment_variables),
+        SECRETS=dict(secrets),
+        SECRET_VERSIONS=dict(secret_versions),
+        ENVIRONMENT_FILE=encode_environment_variables(dict(environment_variables)),
     )
 
 
+def _unique_secrets(used_secrets: dict[str, Secret]) -> list[Secret]:
+    """Return each secret once, even if several environment variables reference it."""
+    return list({secret.resource_name: secret for secret in used_secrets.values()}.values())
+
+
 class AutoScalingCluster(ComponentResource):
     def __init__(  # noqa: PLR0913
         self,
@@ -89,9 +131,8 @@ class AutoScalingCluster(ComponentResource):
 
         if environment_variables is not None:
             # Sort keys for deterministic cloud-init output (avoids spurious Pulumi diffs)
-            for key in sorted(environment_variables):
+            for key, value in sorted(environment_variables.items()):
                 validate_environment_variable_name(key)
-                value = environment_variables[key]
                 if isinstance(value, Secret):
                     used_secrets[key] = value
                 else:
@@ -102,7 +143,7 @@ class AutoScalingCluster(ComponentResource):
 
         secrets_access = list(iam_config_copy.get("secrets_access", []))
         secrets_access.extend(
-            {"secret_slug": secret.resource_name, "secret_arn": secret.arn} for secret in used_secrets.values()
+            {"secret_slug": secret.resource_name, "secret_arn": secret.arn} for secret in _unique_secrets(used_secrets)
         )
         if secrets_access:
             iam_config_copy["secrets_access"] = secrets_access  # type: ignore[typeddict-item]
@@ -152,14 +193,7 @@ class AutoScalingCluster(ComponentResource):
             secrets[secret_env_var] = secret.arn
             secret_versions[secret_env_var] = secret.latest_version
 
-        cloud_init_config = Output.all(
-            runner_image=runner_image,
-            environment_variables=envs,
-            secrets=secrets,
-            secret_versions=secret_versions,
-        ).apply(_get_cloud_init)
-
-        user_data = cloud_init_config.apply(lambda c: base64.b64encode(c.encode()).decode())
+        user_data = _get_user_data(runner_image, envs, secrets, secret_versions)
 
         resolved_ami_id: Input[str]
         if ami_id is not None:
@@ -260,7 +294,7 @@ class AutoScalingCluster(ComponentResource):
                 ),
             ],
             # Ignore desired_capacity changes to avoid overriding autoscaler decisions on pulumi up
-            opts=ResourceOptions(depends_on=[launch_template], parent=self, ignore_changes=["desired_capacity"]),
+            opts=ResourceOptions(parent=self, ignore_changes=["desired_capacity"]),
         )
 
         if cluster_enabled:
@@ -275,7 +309,7 @@ class AutoScalingCluster(ComponentResource):
                     ),
                     target_value=cpu_target * 100,
                 ),
-                opts=ResourceOptions(depends_on=[self.asg], parent=self),
+                opts=ResourceOptions(parent=self),
             )
 
         self.register_outputs({"asg_name": self.asg.name, "asg_arn": self.asg.arn})
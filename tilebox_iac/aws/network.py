@@ -60,7 +60,7 @@ class Network(ComponentResource):
             availability_zone=first_az,
             map_public_ip_on_launch=True,
             tags={"Name": f"{name}-public-subnet"},
-            opts=ResourceOptions(depends_on=[self.vpc], parent=self),
+            opts=ResourceOptions(parent=self),
         )
         self.public_subnet_id = self.public_subnet.id
 
@@ -70,7 +70,7 @@ class Network(ComponentResource):
             cidr_block=private_subnet_cidr,
             availability_zone=first_az,
             tags={"Name": f"{name}-private-subnet"},
-            opts=ResourceOptions(depends_on=[self.vpc], parent=self),
+            opts=ResourceOptions(parent=self),
         )
         self.private_subnet_id = self.private_subnet.id
 
@@ -78,7 +78,7 @@ class Network(ComponentResource):
             f"{name}-igw",
             vpc_id=self.vpc.id,
             tags={"Name": f"{name}-igw"},
-            opts=ResourceOptions(depends_on=[self.vpc], parent=self),
+            opts=ResourceOptions(parent=self),
         )
 
         public_route_table = aws_ec2.RouteTable(
@@ -91,14 +91,14 @@ class Network(ComponentResource):
                 }
             ],
             tags={"Name": f"{name}-public-rt"},
-            opts=ResourceOptions(depends_on=[internet_gateway], parent=self),
+            opts=ResourceOptions(parent=self),
         )
 
         aws_ec2.RouteTableAssociation(
             f"{name}-public-rta",
             subnet_id=self.public_subnet.id,
             route_table_id=public_route_table.id,
-            opts=ResourceOptions(depends_on=[public_route_table, self.public_subnet], parent=self),
+            opts=ResourceOptions(parent=self),
         )
 
         self.private_route_table: aws_ec2.RouteTable | None = None
@@ -117,7 +117,7 @@ class Network(ComponentResource):
                 allocation_id=eip.id,
                 subnet_id=self.public_subnet.id,
                 tags={"Name": f"{name}-nat"},
-                opts=ResourceOptions(depends_on=[eip, self.public_subnet, internet_gateway], parent=self),
+                opts=ResourceOptions(depends_on=[internet_gateway], parent=self),
             )
 
             self.private_route_table = aws_ec2.RouteTable(
@@ -130,14 +130,14 @@ class Network(ComponentResource):
                     }
                 ],
                 tags={"Name": f"{name}-private-rt"},
-                opts=ResourceOptions(depends_on=[nat_gateway], parent=self),
+                opts=ResourceOptions(parent=self),
             )
 
             aws_ec2.RouteTableAssociation(
                 f"{name}-private-rta",
                 subnet_id=self.private_subnet.id,
                 route_table_id=self.private_route_table.id,
-                opts=ResourceOptions(depends_on=[self.private_route_table, self.private_subnet], parent=self),
+                opts=ResourceOptions(parent=self),
             )
 
         # S3 Gateway endpoint avoids NAT Gateway data transfer charges for S3 traffic
@@ -149,7 +149,7 @@ class Network(ComponentResource):
                 vpc_endpoint_type="Gateway",
                 route_table_ids=[self.private_route_table.id],
                 tags={"Name": f"{name}-s3-endpoint"},
-                opts=ResourceOptions(depends_on=[self.private_route_table], parent=self),
+                opts=ResourceOptions(parent=self),
             )
 
         self.register_outputs(
@@ -38,7 +38,7 @@ class Secret(ComponentResource):
             f"{name}-v1",
             secret_id=self.secret.id,
             **secret_kwargs,
-            opts=ResourceOptions(depends_on=[self.secret], parent=self),
+            opts=ResourceOptions(parent=self),
         )
 
         self.id = self.secret.id
@@ -1,8 +1,9 @@
 from collections.abc import Sequence
+from functools import cache
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from pulumi import Alias, ComponentResource, Input, Output, ResourceOptions
 from pulumi_gcp.compute import (
     Firewall,
@@ -18,27 +19,55 @@ from tilebox_iac.gcp.secrets import Secret
 from tilebox_iac.gcp.service_account import ServiceAccount, ServiceAccountConfigDict
 from tilebox_iac.release_runner import RUNNER_IMAGE, encode_environment_variables, validate_environment_variable_name
 
-# This template renders cloud-init YAML rather than HTML.
-env = Environment(loader=FileSystemLoader(Path(__file__).parent), autoescape=False)  # noqa: S701
-template = env.get_template("cloud-init.yaml")
 
-
-def _get_cloud_init(kwargs: dict[str, Any]) -> str:
+def _get_cloud_init(runner_image: str, environment_variables: dict[str, str], secrets: dict[str, str]) -> str:
     """Render the cloud-init config for the GCP VMs."""
-    runner_image: str = kwargs["runner_image"]
+    return _render_cloud_init(runner_image, tuple(environment_variables.items()), tuple(secrets.items()))
+
+
+def _get_cloud_init_config(
+    runner_image: Input[str],
+    environment_variables: dict[str, Input[str]],
+    secrets: dict[str, Input[str]],
+) -> Input[str]:
+    """Render the cloud-init config directly when every input is already known, otherwise through an Output."""
+    plain_environment_variables = {key: value for key, value in environment_variables.items() if isinstance(value, str)}
+    if isinstance(runner_image, str) and not secrets and len(plain_environment_variables) == len(environment_variables):
+        return _get_cloud_init(runner_image, plain_environment_variables, {})
+    return Output.all(runner_image, environment_variables, secrets).apply(lambda values: _get_cloud_init(*values))
+
+
+@cache
+def _get_template() -> Template:
+    """Load the cloud-init template on first use so importing the package does not parse it."""
+    # This template renders cloud-init YAML rather than HTML.
+    env = Environment(loader=FileSystemLoader(Path(__file__).parent), autoescape=False)  # noqa: S701
+    return env.get_template("cloud-init.yaml")
+
+
+@cache
+def _render_cloud_init(
+    runner_image: str,
+    environment_variables: tuple[tuple[str, str], ...],
+    secrets: tuple[tuple[str, str], ...],
+) -> str:
+    """Render the cloud-init template once per distinct set of inputs, since clusters often share them."""
     registry_hostname = runner_image.split("/", maxsplit=1)[0]
     is_gcp_registry = registry_hostname == "gcr.io" or registry_hostname.endswith((".gcr.io", ".pkg.dev"))
-    environment_variables: dict[str, str] = kwargs["environment_variables"]
-    secrets: dict[str, str] = kwargs["secrets"]
 
-    return template.render(
+    return _get_template().render(
         CONTAINER_IMAGE=runner_image,
         GCP_REGISTRY_HOSTNAME=registry_hostname if is_gcp_registry else None,
-        SECRETS=secrets,
-        ENVIRONMENT_FILE=encode_environment_variables(environment_variables),
+        SECRETS=dict(secrets),
+        ENVIRONMENT_FILE=encode_environment_variables(dict(environment_variables)),
     )
 
 
+def _unique_secrets(used_secrets: dict[str, Secret]) -> list[Secret]:
+    """Return each secret once, even if several environment variables reference it."""
+    return list({secret.resource_name: secret for secret in used_secrets.values()}.values())
+
+
 def _get_health_check_network(network_interfaces: Any, health_check_network: str | None) -> str:
     """Resolve the VPC for the health-check firewall from an override or the first instance interface."""
     if health_check_network:
@@ -81,6 +110,7 @@ class AutoScalingCluster(ComponentResource):
         health_check_network: Input[str] | None = None,
         health_check_network_project: Input[str] | None = None,
         auto_healing_enabled: bool = False,
+        service_account: ServiceAccount | None = None,
     ) -> None:
         """An auto-scaling cluster of Spot instances running a Docker container.
 
@@ -105,6 +135,9 @@ class AutoScalingCluster(ComponentResource):
             health_check_network_project: Project that owns the health-check network. Defaults to gcp_project.
             auto_healing_enabled: Whether the MIG replaces instances that fail runner health checks. Enable only after
                 every existing instance has rolled to a template containing the health endpoint.
+            service_account: Existing service account to run the VMs as, e.g. one shared by several clusters. It must
+                already grant roles/monitoring.metricWriter and secretAccessor on every Secret in environment_variables.
+                Cannot be combined with roles. Defaults to a new service account for this cluster.
             opts: Pulumi resource options.
         """
         opts = ResourceOptions.merge(opts, ResourceOptions(aliases=[Alias(type_="tilebox:AutoScalingGCPCluster")]))
@@ -112,6 +145,8 @@ class AutoScalingCluster(ComponentResource):
 
         if environment_variables is None or "TILEBOX_API_KEY" not in environment_variables:
             raise ValueError("environment_variables must include TILEBOX_API_KEY")
+        if service_account is not None and roles is not None:
+            raise ValueError("roles cannot be combined with service_account; grant them on the service account instead")
 
         required_roles = {
             "roles/monitoring.metricWriter",
@@ -120,37 +155,40 @@ class AutoScalingCluster(ComponentResource):
 
         envs: dict[str, Input[str]] = {}
         if environment_variables is not None:
-            for key in sorted(environment_variables):
+            for key, value in sorted(environment_variables.items()):
                 validate_environment_variable_name(key)
-                value = environment_variables[key]
                 if isinstance(value, Secret):
                     used_secrets[key] = value
                 else:
                     envs[key] = value
 
-        if roles is None:
-            role_config: ServiceAccountConfigDict = {"roles": list(required_roles)}
-        else:
-            role_config = dict(roles)  # type: ignore[assignment]
-            configured_roles = set(roles.get("roles", []))
-            role_config["roles"] = list(required_roles | configured_roles)
+        if service_account is None:
+            if roles is None:
+                role_config: ServiceAccountConfigDict = {"roles": list(required_roles)}
+            else:
+                role_config = dict(roles)  # type: ignore[assignment]
+                configured_roles = set(roles.get("roles", []))
+                role_config["roles"] = list(required_roles | configured_roles)
 
-        secret_roles = list(role_config.get("secret_roles", []))
-        secret_roles.extend(
-            [
-                {
-                    "secret_slug": secret.resource_name,
-                    "secret": secret.secret,
-                    "role": "roles/secretmanager.secretAccessor",
-                }
-                for secret in used_secrets.values()
-            ]
-        )
-        role_config["secret_roles"] = secret_roles
+            secret_roles = list(role_config.get("secret_roles", []))
+            secret_roles.extend(
+                [
+                    {
+                        "secret_slug": secret.resource_name,
+                        "secret": secret.secret,
+                        "role": "roles/secretmanager.secretAccessor",
+                    }
+                    for secret in _unique_secrets(used_secrets)
+                ]
+            )
+            role_config["secret_roles"] = secret_roles
 
-        service_account = ServiceAccount.from_config(
-            name, gcp_project, role_config, opts=ResourceOptions(depends_on=[*list(used_secrets.values())], parent=self)
-        )
+            service_account = ServiceAccount.from_config(
+                name,
+                gcp_project,
+                role_config,
+                opts=ResourceOptions(depends_on=[*list(used_secrets.values())], parent=self),
+            )
 
         health_check = RegionHealthCheck(
             f"{name}-health-check",
@@ -181,18 +219,14 @@ class AutoScalingCluster(ComponentResource):
             source_ranges=["130.211.0.0/22", "35.191.0.0/16"],
             target_service_accounts=[service_account.email],
             allows=[{"protocol": "tcp", "ports": ["8080"]}],
-            opts=ResourceOptions(depends_on=[service_account], parent=self),
+            opts=ResourceOptions(parent=self),
         )
 
         secrets = {}
         for secret_env_var, secret in used_secrets.items():
             secrets[secret_env_var] = secret.secret.id
 
-        cloud_init_config = Output.all(
-            runner_image=runner_image,
-            environment_variables=envs,
-            secrets=secrets,
-        ).apply(_get_cloud_init)
+        cloud_init_config = _get_cloud_init_config(runner_image, envs, secrets)
 
         instance_template = InstanceTemplate(
             f"{name}-template",
@@ -223,7 +257,9 @@ class AutoScalingCluster(ComponentResource):
                 "on_host_maintenance": "TERMINATE",
                 "instance_termination_action": "STOP",
             },
-            opts=ResourceOptions(depends_on=[service_account], parent=self),
+            # Depend on whole components so instances boot with their IAM grants and secret versions in place;
+            # cloud-init only references the secret IDs, which don't cover the versions.
+            opts=ResourceOptions(depends_on=[service_account, *used_secrets.values()], parent=self),
         )
 
         mig = RegionInstanceGroupManager(
@@ -251,10 +287,8 @@ class AutoScalingCluster(ComponentResource):
                 if auto_healing_enabled
                 else None
             ),
-            opts=ResourceOptions(
-                depends_on=[instance_template, health_check, health_check_firewall],
-                parent=self,
-            ),
+            # Instances must not start before health-check probes can reach them.
+            opts=ResourceOptions(depends_on=[health_check_firewall], parent=self),
         )
 
         if cluster_enabled:
@@ -278,7 +312,7 @@ class AutoScalingCluster(ComponentResource):
                     "target": cpu_target,
                 },
             },
-            opts=ResourceOptions(depends_on=[mig], parent=self),
+            opts=ResourceOptions(parent=self),
         )
 
         self.register_outputs({})
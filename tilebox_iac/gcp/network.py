@@ -40,7 +40,7 @@ class Network(ComponentResource):
             network=self.network.self_link,
             region=gcp_region,
             private_ip_google_access=enable_private_google_access,
-            opts=ResourceOptions(depends_on=[self.network], parent=self),
+            opts=ResourceOptions(parent=self),
         )
 
         if enable_internet_access:
@@ -49,7 +49,7 @@ class Network(ComponentResource):
                 name=f"{name}-router",
                 network=self.network.self_link,
                 region=gcp_region,
-                opts=ResourceOptions(depends_on=[self.network], parent=self),
+                opts=ResourceOptions(parent=self),
             )
             self.router_nat = RouterNat(
                 f"{name}-nat",
@@ -64,7 +64,7 @@ class Network(ComponentResource):
                     }
                 ],
                 nat_ip_allocate_option="AUTO_ONLY",
-                opts=ResourceOptions(depends_on=[self.router], parent=self),
+                opts=ResourceOptions(parent=self),
             )
 
         self.id = self.network.id
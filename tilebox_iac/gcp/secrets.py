@@ -34,7 +34,7 @@ class Secret(ComponentResource):
             secret=self.secret.id,
             secret_data=secret_data,
             is_secret_data_base64=is_secret_data_base64,
-            opts=ResourceOptions(depends_on=[self.secret], parent=self),
+            opts=ResourceOptions(parent=self),
         )
 
         self.id = self.secret.secret_id
@@ -1,17 +1,23 @@
 import re
-from collections.abc import Sequence
-from typing import TypedDict
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from functools import cache
+from typing import Literal, TypedDict, TypeVar
 
-from pulumi import Alias, ComponentResource, Output, ResourceOptions
-from pulumi_gcp.artifactregistry import Repository, RepositoryIamMember
+from pulumi import Alias, ComponentResource, Input, Output, ResourceOptions
+from pulumi_gcp.artifactregistry import Repository, RepositoryIamBinding, RepositoryIamMember
+from pulumi_gcp.cloudrun import IamBinding as CloudrunServiceIamBinding
 from pulumi_gcp.cloudrun import IamMember as CloudrunServiceIamMember
 from pulumi_gcp.cloudrunv2 import Service
-from pulumi_gcp.projects import IAMMember
-from pulumi_gcp.secretmanager import Secret, SecretIamMember
+from pulumi_gcp.projects import IAMBinding, IAMMember
+from pulumi_gcp.secretmanager import Secret, SecretIamBinding, SecretIamMember
 from pulumi_gcp.serviceaccount import Account
-from pulumi_gcp.storage import AwaitableGetBucketResult, Bucket, BucketIAMMember
+from pulumi_gcp.storage import AwaitableGetBucketResult, Bucket, BucketIAMBinding, BucketIAMMember
 from typing_extensions import NotRequired
 
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+_T = TypeVar("_T")
+BindingMode = Literal["member", "binding"]
+
 
 class BucketRoleDict(TypedDict):
     """Same as BucketRole, but as a typed dictionary."""
@@ -66,6 +72,8 @@ class ServiceAccount(ComponentResource):
         repository_roles: Sequence[RepositoryRoleDict] | None = None,
         secret_roles: Sequence[SecretRoleDict] | None = None,
         opts: ResourceOptions | None = None,
+        *,
+        binding_mode: BindingMode = "member",
     ) -> None:
         """Create a service account with given roles.
 
@@ -78,12 +86,21 @@ class ServiceAccount(ComponentResource):
             repository_roles: Repository specific roles for certain artifact registry repositories.
             secret_roles: Secret specific roles for certain secrets.
             opts: Pulumi resource options.
+            binding_mode: "member" adds the service account to each role without affecting other members. "binding"
+                makes the service account the only member of each role on the project or resource, which replaces
+                members granted elsewhere. Use "binding" only when nothing else manages the same roles.
+                Switching an existing service account between modes revokes its roles: Pulumi creates the new IAM
+                resources first and deletes the old ones at the end of the update, and that deletion removes the
+                service account from the roles again. Run `pulumi up --refresh` after the switch to restore them.
         """
         opts = ResourceOptions.merge(
             opts, ResourceOptions(aliases=[Alias(type_="tilebox:service_account:ServiceAccount")])
         )
         super().__init__("tilebox:gcp:ServiceAccount", name, opts=opts)
 
+        if binding_mode not in ("member", "binding"):
+            raise ValueError(f"Invalid binding_mode: {binding_mode!r}. Must be 'member' or 'binding'.")
+
         self.service_account = Account(
             f"{name}-service-account",
             account_id=name,
@@ -92,70 +109,79 @@ class ServiceAccount(ComponentResource):
             opts=ResourceOptions(parent=self),
         )
 
-        service_account_member = Output.concat("serviceAccount:", self.service_account.email)
-
-        self.roles = []
-        for role in roles or []:
-            self.roles.append(
-                IAMMember(
-                    f"{name}-role-{_role_to_slug(role)}",
-                    role=role,
-                    member=service_account_member,
-                    project=gcp_project,
-                    opts=ResourceOptions(depends_on=[self.service_account], parent=self),
-                )
+        service_account_member = self.service_account.email.apply(lambda email: f"serviceAccount:{email}")
+        # Resources copy their options on construction, so all bindings can share one instance.
+        binding_opts = ResourceOptions(parent=self)
+
+        self.roles = tuple(
+            _project_iam(
+                f"{name}-role-{_role_to_slug(role)}",
+                binding_mode,
+                service_account_member,
+                role=role,
+                project=gcp_project,
+                opts=binding_opts,
             )
+            for role in dict.fromkeys(roles or [])
+        )
 
-        self.bucket_roles = []
-        for bucket_role in bucket_roles or []:
-            self.bucket_roles.append(
-                BucketIAMMember(
-                    f"{name}-bucket-{bucket_role['bucket_slug']}-role-{_role_to_slug(bucket_role['role'])}",
-                    bucket=bucket_role["bucket"].name,
-                    role=bucket_role["role"],
-                    member=service_account_member,
-                    opts=ResourceOptions(depends_on=[self.service_account], parent=self),
-                )
+        self.bucket_roles = tuple(
+            _bucket_iam(
+                f"{name}-bucket-{bucket_role['bucket_slug']}-role-{_role_to_slug(bucket_role['role'])}",
+                binding_mode,
+                service_account_member,
+                bucket=bucket_role["bucket"].name,
+                role=bucket_role["role"],
+                opts=binding_opts,
             )
+            for bucket_role in _deduplicate(
+                bucket_roles or [], lambda r: (r["bucket_slug"], r["role"]), lambda r: r["bucket"]
+            )
+        )
 
-        self.service_roles = []
-        for service_role in service_roles or []:
-            self.service_roles.append(
-                CloudrunServiceIamMember(
-                    f"{name}-service-{service_role['service_slug']}-role-{_role_to_slug(service_role['role'])}",
-                    service=service_role["service"].name,
-                    role=service_role["role"],
-                    member=service_account_member,
-                    opts=ResourceOptions(depends_on=[self.service_account], parent=self),
-                )
+        self.service_roles = tuple(
+            _service_iam(
+                f"{name}-service-{service_role['service_slug']}-role-{_role_to_slug(service_role['role'])}",
+                binding_mode,
+                service_account_member,
+                service=service_role["service"].name,
+                role=service_role["role"],
+                opts=binding_opts,
+            )
+            for service_role in _deduplicate(
+                service_roles or [], lambda r: (r["service_slug"], r["role"]), lambda r: r["service"]
             )
+        )
 
-        self.repository_roles = []
-        for repository_role in repository_roles or []:
-            repository = repository_role["repository"]
-            self.repository_roles.append(
-                RepositoryIamMember(
-                    f"{name}-repository-{repository_role['repository_slug']}-role-{_role_to_slug(repository_role['role'])}",
-                    project=repository.project,
-                    location=repository.location,
-                    repository=repository.name,
-                    role=repository_role["role"],
-                    member=service_account_member,
-                    opts=ResourceOptions(depends_on=[self.service_account], parent=self),
-                )
+        self.repository_roles = tuple(
+            _repository_iam(
+                f"{name}-repository-{repository_role['repository_slug']}-role-{_role_to_slug(repository_role['role'])}",
+                binding_mode,
+                service_account_member,
+                project=repository_role["repository"].project,
+                location=repository_role["repository"].location,
+                repository=repository_role["repository"].name,
+                role=repository_role["role"],
+                opts=binding_opts,
+            )
+            for repository_role in _deduplicate(
+                repository_roles or [], lambda r: (r["repository_slug"], r["role"]), lambda r: r["repository"]
             )
+        )
 
-        self.secret_roles = []
-        for secret_role in secret_roles or []:
-            self.secret_roles.append(
-                SecretIamMember(
-                    f"{name}-secret-{secret_role['secret_slug']}-role-{_role_to_slug(secret_role['role'])}",
-                    secret_id=secret_role["secret"].id,
-                    role=secret_role["role"],
-                    member=service_account_member,
-                    opts=ResourceOptions(depends_on=[self.service_account], parent=self),
-                )
+        self.secret_roles = tuple(
+            _secret_iam(
+                f"{name}-secret-{secret_role['secret_slug']}-role-{_role_to_slug(secret_role['role'])}",
+                binding_mode,
+                service_account_member,
+                secret_id=secret_role["secret"].id,
+                role=secret_role["role"],
+                opts=binding_opts,
             )
+            for secret_role in _deduplicate(
+                secret_roles or [], lambda r: (r["secret_slug"], r["role"]), lambda r: r["secret"]
+            )
+        )
 
         self.id = self.service_account.id
         self.email = self.service_account.email
@@ -173,10 +199,12 @@ class ServiceAccount(ComponentResource):
         gcp_project: str,
         config: ServiceAccountConfigDict | None,
         opts: ResourceOptions | None = None,
+        *,
+        binding_mode: BindingMode = "member",
     ) -> "ServiceAccount":
         """Create a service account from a config."""
         if config is None:
-            return cls(name, gcp_project, opts=opts)
+            return cls(name, gcp_project, opts=opts, binding_mode=binding_mode)
 
         return cls(
             name,
@@ -187,11 +215,113 @@ class ServiceAccount(ComponentResource):
             repository_roles=config.get("repository_roles"),
             secret_roles=config.get("secret_roles"),
             opts=opts,
+            binding_mode=binding_mode,
+        )
+
+
+def _project_iam(  # noqa: PLR0913
+    resource_name: str,
+    binding_mode: BindingMode,
+    member: Output[str],
+    *,
+    project: Input[str],
+    role: Input[str],
+    opts: ResourceOptions,
+) -> IAMMember | IAMBinding:
+    if binding_mode == "member":
+        return IAMMember(resource_name, member=member, project=project, role=role, opts=opts)
+    return IAMBinding(resource_name, members=[member], project=project, role=role, opts=opts)
+
+
+def _bucket_iam(  # noqa: PLR0913
+    resource_name: str,
+    binding_mode: BindingMode,
+    member: Output[str],
+    *,
+    bucket: Input[str],
+    role: Input[str],
+    opts: ResourceOptions,
+) -> BucketIAMMember | BucketIAMBinding:
+    if binding_mode == "member":
+        return BucketIAMMember(resource_name, member=member, bucket=bucket, role=role, opts=opts)
+    return BucketIAMBinding(resource_name, members=[member], bucket=bucket, role=role, opts=opts)
+
+
+def _service_iam(  # noqa: PLR0913
+    resource_name: str,
+    binding_mode: BindingMode,
+    member: Output[str],
+    *,
+    service: Input[str],
+    role: Input[str],
+    opts: ResourceOptions,
+) -> CloudrunServiceIamMember | CloudrunServiceIamBinding:
+    if binding_mode == "member":
+        return CloudrunServiceIamMember(resource_name, member=member, service=service, role=role, opts=opts)
+    return CloudrunServiceIamBinding(resource_name, members=[member], service=service, role=role, opts=opts)
+
+
+def _repository_iam(  # noqa: PLR0913
+    resource_name: str,
+    binding_mode: BindingMode,
+    member: Output[str],
+    *,
+    project: Input[str],
+    location: Input[str],
+    repository: Input[str],
+    role: Input[str],
+    opts: ResourceOptions,
+) -> RepositoryIamMember | RepositoryIamBinding:
+    if binding_mode == "member":
+        return RepositoryIamMember(
+            resource_name,
+            member=member,
+            project=project,
+            location=location,
+            repository=repository,
+            role=role,
+            opts=opts,
         )
+    return RepositoryIamBinding(
+        resource_name,
+        members=[member],
+        project=project,
+        location=location,
+        repository=repository,
+        role=role,
+        opts=opts,
+    )
+
 
+def _secret_iam(  # noqa: PLR0913
+    resource_name: str,
+    binding_mode: BindingMode,
+    member: Output[str],
+    *,
+    secret_id: Input[str],
+    role: Input[str],
+    opts: ResourceOptions,
+) -> SecretIamMember | SecretIamBinding:
+    if binding_mode == "member":
+        return SecretIamMember(resource_name, member=member, secret_id=secret_id, role=role, opts=opts)
+    return SecretIamBinding(resource_name, members=[member], secret_id=secret_id, role=role, opts=opts)
 
+
+@cache
 def _role_to_slug(role: str) -> str:
     """Convert a role to a slug."""
     parts = role.removeprefix("roles/").split(".")
-    parts = [re.sub(r"(?<!^)(?=[A-Z])", "-", part).lower() for part in parts]
+    # Most segments (e.g. "storage", "run") are already lowercase and need no camelCase split.
+    parts = [part if part.islower() else _CAMEL_CASE_BOUNDARY.sub("-", part).lower() for part in parts]
     return "-".join(parts)
+
+
+def _deduplicate(items: Iterable[_T], key: Callable[[_T], Hashable], target: Callable[[_T], object]) -> list[_T]:
+    """Drop repeated bindings for the same target, and reject different targets that would share a resource name."""
+    unique: dict[Hashable, _T] = {}
+    for item in items:
+        item_key = key(item)
+        existing = unique.setdefault(item_key, item)
+        if target(existing) is not target(item):
+            raise ValueError(f"Role bindings {item_key!r} share a slug and role but target different resources")
+    return list(unique.values())